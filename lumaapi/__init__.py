@@ -20,27 +20,292 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os
-import shutil
-from typing import Optional, List, Dict
-import uuid
-import urllib.parse
+import sys
+import contextlib
+import mmap
+import stat
+from typing import Optional, List, Dict, Union, IO
+import io
+import tempfile
+import itertools
+import functools
+import zipfile
 from enum import Enum
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import enum_tools.documentation
 import time
 import json
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 
 import platformdirs
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
 
 CACHE_DIR = platformdirs.user_config_dir("luma")
+API_KEY_FILE = os.path.join(CACHE_DIR, "api_key")
+# JSON headers written by older versions, read only if API_KEY_FILE is missing
+# and removed once it is written
 AUTH_FILE = os.path.join(CACHE_DIR, "auth.json")
 API_BASE_URL = "https://webapp.engineeringlumalabs.com/api/v2/"
+UPLOAD_BLOCK_SIZE = 1 << 20
+# (connect, read) timeouts in seconds, longer read timeout for uploads
+DEFAULT_TIMEOUT = (3.05, 30)
+UPLOAD_TIMEOUT = (3.05, 600)
+
+# Retry policy for gateway errors on either transport
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUSES = (502, 503, 504)
+# Idempotent methods, which urllib3 also retries by default
+_RETRY_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"))
+
+# Retry policy for triggering processing right after the upload
+_TRIGGER_RETRY_DELAYS = (0.05, 0.15, 0.5)
+_TRIGGER_RETRY_STATUSES = (404, 409, 425)
+
+# Directories zipping to more than this are archived on disk rather than in memory
+_IN_MEMORY_ZIP_SIZE = 64 << 20
+
+# Pooled connections per host, also the default concurrency of batch methods
+_POOL_MAXSIZE = 8
+
+# Number of captures requested per page by get_all
+_PAGE_SIZE = 50
 
+# Slotted dataclasses (Python 3.10+) skip the per-instance __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Progress of submissions is logged at INFO level, unless silent=True
+_logger = logging.getLogger(__name__)
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+else:
+    _json_loads = json.loads
+
+
+if ciso8601 is not None:
+    _parse_date = ciso8601.parse_datetime
+elif sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing Z of API dates from 3.11
+    _parse_date = datetime.fromisoformat
+else:
+    # Swapping the offset into the string is faster than datetime.replace(tzinfo=...)
+    def _parse_date(value: str) -> datetime:
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+
+
+def _scan_files(src_dir: str, prefix: str = ""):
+    """
+    Yield (path, arcname, size) for every file under src_dir, recursively.
+    Like os.walk, symlinked directories are not followed.
+    """
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, prefix + entry.name + "/")
+            elif entry.is_file():
+                yield entry.path, prefix + entry.name, entry.stat().st_size
+
+
+def _write_zip(f: IO[bytes], files: List):
+    """
+    Write files (from _scan_files) to f as a zip archive without compression.
+    Captures are images/videos which are already compressed, so deflating
+    them costs CPU time for almost no size reduction.
+    """
+    with zipfile.ZipFile(f, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for path, arcname, _ in files:
+            zf.write(path, arcname=arcname)
+
+
+@contextlib.contextmanager
+def _zipped_directory(src_dir: str):
+    """
+    Archive src_dir and yield the archive as a buffer for upload, or as a
+    file object if the temporary file cannot be mapped.
+    Small directories are archived in memory, larger ones in an anonymous
+    temporary file, so nothing is written next to src_dir.
+    """
+    files = list(_scan_files(src_dir))
+    if sum(size for _, _, size in files) <= _IN_MEMORY_ZIP_SIZE:
+        buffer = io.BytesIO()
+        _write_zip(buffer, files)
+        view = buffer.getbuffer()
+        try:
+            yield view
+        finally:
+            view.release()
+    else:
+        with tempfile.TemporaryFile() as f:
+            _write_zip(f, files)
+            with _mapped_file(f) as view:
+                yield view
+
+
+def _write_secret(path: str, secret: str):
+    """
+    Atomically replace the file at path with secret, readable only by the current user
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".api_key")
+    try:
+        with os.fdopen(fd, "w") as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), 0o600)
+            f.write(secret)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_cached_auth() -> Optional[Dict[str, str]]:
+    """
+    Load auth headers from API_KEY_FILE, falling back to the AUTH_FILE
+    written by older versions. Returns None if neither exists.
+    """
+    try:
+        with open(API_KEY_FILE, "r") as f:
+            return {"Authorization": 'luma-api-key=' + f.read().strip()}
+    except FileNotFoundError:
+        pass
+    try:
+        with open(AUTH_FILE, "r") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _is_regular_file(f) -> bool:
+    """
+    Whether f is backed by a regular file, so its size can be taken from fstat.
+    Pipes, FIFOs and character devices report size 0 whatever they hold.
+    """
+    try:
+        return stat.S_ISREG(os.fstat(f.fileno()).st_mode)
+    except (AttributeError, OSError):
+        return False
+
+
+@contextlib.contextmanager
+def _mapped_file(f: IO[bytes]):
+    """
+    Map the open file f read-only and yield a memoryview of it, so it can be
+    uploaded from the page cache without being copied into Python bytes.
+    Empty files cannot be mapped and yield b"" instead. Files which are not
+    regular or cannot be mapped yield f itself, rewound where possible
+    so that, like the mapping, it is streamed from the start.
+    """
+    f.flush()
+    if not _is_regular_file(f):
+        if f.seekable():
+            f.seek(0)
+        yield f
+        return
+    if os.fstat(f.fileno()).st_size == 0:
+        yield b""
+        return
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError:
+        f.seek(0)
+        yield f
+        return
+    with mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            # Uploads read front to back, so let the kernel read ahead aggressively
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            view.release()
+
+
+def _as_list(value: Union[str, List[str]]) -> List[str]:
+    """
+    Accept a single str in place of a list, as fire passes a lone
+    CLI value as a str, which would otherwise be iterated by character
+    """
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _map_collecting_errors(fn, max_workers: int, *iterables) -> list:
+    """
+    Like ThreadPoolExecutor.map, but an exception raised for one item is
+    returned in its place rather than discarding the results of the others
+    """
+    def call(*args):
+        try:
+            return fn(*args)
+        except Exception as ex:
+            return ex
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call, *iterables))
+
+
+def _iter_buffer(view: memoryview):
+    """
+    Yield view in UPLOAD_BLOCK_SIZE byte blocks, for clients which stream iterables
+    """
+    for start in range(0, len(view), UPLOAD_BLOCK_SIZE):
+        yield bytes(view[start:start + UPLOAD_BLOCK_SIZE])
+
+
+class _ParseMap(dict):
+    """
+    Name -> member lookup used by enum parse(). Names which are not found are
+    matched case-insensitively, and memoized so the same spelling is a plain
+    dict hit next time. Unknown names give None.
+    """
+    def __missing__(self, name: str):
+        member = self.get(name.upper())
+        if member is not None:
+            self[name] = member
+        return member
+
+
+def _with_parse_map(cls):
+    """
+    Class decorator precomputing the _ParseMap used by parse(),
+    keyed by member name, lowercase name and string value
+    """
+    parse_map = _ParseMap()
+    for member in cls:
+        parse_map[member.name] = member
+        parse_map[member.name.lower()] = member
+        if isinstance(member.value, str):
+            parse_map[member.value] = member
+    cls._PARSE_MAP = parse_map
+    return cls
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LumaCreditInfo:
     """
     Response of credits query
@@ -61,6 +326,7 @@ class LumaCreditInfo:
     """
 
 @enum_tools.documentation.document_enum
+@_with_parse_map
 class CaptureType(Enum):
     """
     Capture types.
@@ -70,9 +336,10 @@ class CaptureType(Enum):
 
     @classmethod
     def parse(cls, name: str) -> "CaptureType":
-        return getattr(cls, name.upper(), None)
+        return cls._PARSE_MAP[name]
 
 @enum_tools.documentation.document_enum
+@_with_parse_map
 class CameraType(Enum):
     """
     Camera types
@@ -83,10 +350,11 @@ class CameraType(Enum):
 
     @classmethod
     def parse(cls, name: str) -> "CameraType":
-        return getattr(cls, name.upper(), None)
+        return cls._PARSE_MAP[name]
 
 
 @enum_tools.documentation.document_enum
+@_with_parse_map
 class PrivacyLevel(Enum):
     """
     Privacy levels for capture
@@ -98,9 +366,10 @@ class PrivacyLevel(Enum):
 
     @classmethod
     def parse(cls, name: str) -> "PrivacyLevel":
-        return getattr(cls, name.upper(), None)
+        return cls._PARSE_MAP[name]
 
 @enum_tools.documentation.document_enum
+@_with_parse_map
 class CaptureStatus(Enum):
     """
     Capture upload status. Not to be confused with :class:`.RunStatus`
@@ -113,9 +382,9 @@ class CaptureStatus(Enum):
 
     @classmethod
     def parse(cls, name: str) -> "CaptureStatus":
-        return getattr(cls, name.upper(), None)
+        return cls._PARSE_MAP[name]
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CaptureLocation:
     """
     Capture location information.
@@ -140,11 +409,9 @@ class CaptureLocation:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "CaptureLocation":
-        return cls(
-                latitude=data.get("latitude", 0.0),
-                longitude=data.get("longitude", 0.0),
-                name=data.get("name", ""),
-                is_visible=data.get("is_visible", True))
+        get = data.get
+        return cls(get("latitude", 0.0), get("longitude", 0.0),
+                   get("name", ""), get("is_visible", True))
 
     def to_dict(self):
         return {
@@ -156,6 +423,7 @@ class CaptureLocation:
 
 
 @enum_tools.documentation.document_enum
+@_with_parse_map
 class RunStatus(Enum):
     """
     Capture run status
@@ -167,10 +435,10 @@ class RunStatus(Enum):
 
     @classmethod
     def parse(cls, name: str) -> "RunStatus":
-        return getattr(cls, name.upper(), None)
+        return cls._PARSE_MAP[name]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LumaRunInfo:
     status: RunStatus
     """
@@ -192,7 +460,7 @@ class LumaRunInfo:
     List of output artifacts (each entry has keys type and url)
     """
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LumaCaptureInfo:
     title: str
     """ Capture title """
@@ -211,21 +479,31 @@ class LumaCaptureInfo:
     latest_run: Optional[LumaRunInfo]
 
     @classmethod
-    def from_dict(cls, data: Dict) -> "LumaCaptureInfo":
+    def from_dict(cls, data: Dict,
+                  _parse_type=CaptureType._PARSE_MAP.__getitem__,
+                  _parse_privacy=PrivacyLevel._PARSE_MAP.__getitem__,
+                  _parse_status=CaptureStatus._PARSE_MAP.__getitem__,
+                  _parse_run_status=RunStatus._PARSE_MAP.__getitem__,
+                  _location_from_dict=CaptureLocation.from_dict,
+                  _run_info=LumaRunInfo,
+                  _parse_date=_parse_date) -> "LumaCaptureInfo":
+        # Globals are bound as default arguments and fields passed positionally
+        # (in declaration order) since this runs once per capture in get()
         lrun = data.get("latestRun", None)
-        return LumaCaptureInfo(
-            title=data["title"],
-            type=CaptureType.parse(data["type"]),
-            location=CaptureLocation.from_dict(data["location"]) if data["location"] is not None else None,
-            privacy=PrivacyLevel.parse(data["privacy"]),
-            date=datetime.fromisoformat(data["date"][:-1] + '+00:00'),
-            username=data["username"],
-            status=CaptureStatus.parse(data["status"]),
-            latest_run=LumaRunInfo(
-                    status=RunStatus.parse(lrun["status"]),
-                    progress=lrun["progress"],
-                    current_stage=lrun["currentStage"],
-                    artifacts=lrun["artifacts"],
+        location = data["location"]
+        return cls(
+            data["title"],
+            _parse_type(data["type"]),
+            _location_from_dict(location) if location is not None else None,
+            _parse_privacy(data["privacy"]),
+            _parse_date(data["date"]),
+            data["username"],
+            _parse_status(data["status"]),
+            _run_info(
+                    _parse_run_status(lrun["status"]),
+                    lrun["progress"],
+                    lrun["currentStage"],
+                    lrun["artifacts"],
                 ) if lrun is not None else None
         )
 
@@ -281,19 +559,162 @@ class LumaClient:
     :param api_key: API key. If None, will be requested when needed
     :param is_cli: Whether this is being used as a CLI (internal use only)
     :param use_cache: Whether to cache the auth headers (default True)
+    :param http2: Whether to send requests over HTTP/2 using httpx (default False).
+                  Requires :code:`pip install lumaapi[http2]`.
+                  Responses and errors are still reported with the requests types
+                  (e.g. :code:`requests.HTTPError`), as without HTTP/2
     """
     def __init__(self,
                  api_key: Optional[str] = None,
                  is_cli: bool = False,
-                 use_cache: bool = True):
+                 use_cache: bool = True,
+                 http2: bool = False):
         """
         Construct LumaClient
         """
         self.auth_header = None
         self.is_cli = is_cli
         self.use_cache = use_cache
+        self._capture_url = API_BASE_URL + "capture"
+        # Shared session so consecutive calls reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE,
+                              max_retries=Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF,
+                                                status_forcelist=_RETRY_STATUSES,
+                                                raise_on_status=False))
+        self.session.mount("https://", adapter)
+
+        # Optional HTTP/2 transport, used instead of the session when enabled
+        self._http = None
+        if http2:
+            if httpx is None:
+                raise ImportError("http2=True requires httpx, install with: pip install lumaapi[http2]")
+            # Follow redirects as requests does, httpx does not by default
+            self._http = httpx.Client(follow_redirects=True, transport=httpx.HTTPTransport(
+                http2=True, retries=3,
+                limits=httpx.Limits(max_keepalive_connections=8)))
+
         if api_key is not None:
             self.auth(api_key)
+        else:
+            # Load cached auth once up front so API calls skip the file read
+            try:
+                result = _read_cached_auth()
+            except (OSError, ValueError):
+                result = None
+            if result is not None:
+                self._set_auth_header(result)
+
+    def __enter__(self) -> "LumaClient":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        **[Python only]**
+        Close the underlying HTTP session and release pooled connections.
+        Also called when LumaClient is used as a context manager.
+        """
+        self.session.close()
+        if self._http is not None:
+            self._http.close()
+
+    def _request(self, method: str, url: str, data=None, **kwargs) -> requests.Response:
+        """
+        Send a request through the httpx client if HTTP/2 is enabled,
+        otherwise through the requests session
+        """
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        if self._http is not None:
+            view = None
+            if isinstance(data, (bytearray, mmap.mmap)):
+                # Send other buffers like memoryviews, released once sent
+                data = view = memoryview(data)
+            try:
+                return self._request_httpx(method, url, data, **kwargs)
+            finally:
+                if view is not None:
+                    view.release()
+        return self.session.request(method, url, data=data, **kwargs)
+
+    def _request_httpx(self, method: str, url: str, data, headers=None, timeout=None,
+                       **kwargs) -> requests.Response:
+        """
+        Send a request through the httpx client, with the same status retries as
+        the requests adapter. The response and any errors are converted to their
+        requests equivalents, so callers handle both transports alike.
+        """
+        connect_timeout, read_timeout = timeout
+        kwargs["timeout"] = httpx.Timeout(read_timeout, connect=connect_timeout)
+        headers = headers or {}
+        # Only bodies which can be sent again are retried, as with urllib3
+        replayable = data is None or isinstance(data, (dict, bytes, memoryview))
+        if isinstance(data, dict):
+            kwargs["data"] = data
+        elif isinstance(data, memoryview):
+            headers = dict(headers, **{"Content-Length": str(data.nbytes)})
+        elif hasattr(data, "read") and hasattr(data, "fileno") and not _is_regular_file(data):
+            # httpx would send the fstat size (0) of a pipe as Content-Length,
+            # stream it chunked instead
+            kwargs["content"] = iter(functools.partial(data.read, UPLOAD_BLOCK_SIZE), b"")
+        elif data is not None:
+            kwargs["content"] = data
+        retries = _RETRY_TOTAL if replayable and method in _RETRY_METHODS else 0
+
+        for attempt in range(retries + 1):
+            if isinstance(data, memoryview):
+                # httpx cannot send buffers directly, stream them with a known length
+                kwargs["content"] = _iter_buffer(data)
+            # Like requests, a None header value drops a client-level header
+            request = self._http.build_request(
+                    method, url,
+                    headers={k: v for k, v in headers.items() if v is not None},
+                    **kwargs)
+            for key, value in headers.items():
+                if value is None:
+                    request.headers.pop(key, None)
+            try:
+                response = self._http.send(request)
+            except httpx.ConnectTimeout as ex:
+                raise requests.ConnectTimeout(str(ex)) from ex
+            except httpx.ReadTimeout as ex:
+                raise requests.ReadTimeout(str(ex)) from ex
+            except httpx.TimeoutException as ex:
+                raise requests.Timeout(str(ex)) from ex
+            except httpx.TransportError as ex:
+                raise requests.ConnectionError(str(ex)) from ex
+            except httpx.DecodingError as ex:
+                raise requests.exceptions.ContentDecodingError(str(ex)) from ex
+            except httpx.TooManyRedirects as ex:
+                raise requests.TooManyRedirects(str(ex)) from ex
+            except httpx.RequestError as ex:
+                raise requests.RequestException(str(ex)) from ex
+            if response.status_code not in _RETRY_STATUSES or attempt == retries:
+                break
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.reason = response.reason_phrase
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.url = str(response.url)
+        result.encoding = response.encoding
+        result.raw = io.BytesIO(response.content)
+        return result
+
+    def _set_auth_header(self, header: Optional[Dict[str, str]]):
+        """
+        Store header and send it by default on every request from this client
+        """
+        self.auth_header = header
+        clients = [self.session] if self._http is None else [self.session, self._http]
+        for client in clients:
+            if header is None:
+                client.headers.pop("Authorization", None)
+            else:
+                client.headers.update(header)
 
 
     def credits(self) -> LumaCreditInfo:
@@ -306,10 +727,10 @@ class LumaClient:
 
         :return: LumaCreditInfo
         """
-        auth_headers = self.auth()
-        response = requests.get(f"{API_BASE_URL}capture/credits", headers=auth_headers)
+        self.auth()
+        response = self._request("GET", self._capture_url + "/credits")
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         if self.is_cli:
             # Force fire to display it rather than trying to
             # run subcommands
@@ -333,11 +754,13 @@ class LumaClient:
         :return: dict, headers to use for authenticated requests (:code:`Authorization: luma-api-key=<api_key>`)
         """
         if api_key is None and self.auth_header is not None:
-            result = self.auth_header
-        elif api_key is None and os.path.isfile(AUTH_FILE):
-            with open(AUTH_FILE, "r") as f:
-                result = json.load(f)
-                self.auth_header = result
+            return self.auth_header
+
+        # Re-read the cache here rather than at construction, in case it
+        # was written since, e.g. by luma auth in another process
+        result = _read_cached_auth() if api_key is None else None
+        if result is not None:
+            self._set_auth_header(result)
         else:
             # Prompt user for API key
             if api_key is None:
@@ -345,18 +768,27 @@ class LumaClient:
             result = {"Authorization": 'luma-api-key=' + api_key}
             if self.use_cache:
                 os.makedirs(CACHE_DIR, exist_ok=True)
-                with open(AUTH_FILE, "w") as f:
-                    json.dump(result, f)
+                _write_secret(API_KEY_FILE, api_key)
+                # Migrated, so an older version reading it prompts rather than using a stale key
+                try:
+                    os.remove(AUTH_FILE)
+                except FileNotFoundError:
+                    pass
 
             print("Verifying api-key...")
-            # Check it by getting credits
+            # Check it by getting credits, which picks up the new header
+            self._set_auth_header(result)
             try:
                 self.credits()
             except Exception as ex:
                 print("401 invalid API key, please obtain one from https://lumalabs.ai/dashboard/api")
-                os.remove(AUTH_FILE)
+                self._set_auth_header(None)
+                if self.use_cache:
+                    try:
+                        os.remove(API_KEY_FILE)
+                    except FileNotFoundError:
+                        pass
                 raise ex
-            self.auth_header = result
 
         return result
 
@@ -367,10 +799,15 @@ class LumaClient:
 
             luma clear-auth
 
-        Remove cached authorization (:meth:`.auth`) if present
+        Remove cached authorization (:meth:`.auth`) if present,
+        including the key held in memory by this client
         """
-        if os.path.isfile(AUTH_FILE):
-            os.remove(AUTH_FILE)
+        for path in (API_KEY_FILE, AUTH_FILE):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._set_auth_header(None)
 
 
     def submit(self,
@@ -392,32 +829,29 @@ class LumaClient:
         :param path: str, path to video, zip of images, zip of multiple videos, or directory (with images) to submit
         :param title: str, a descriptive title for the capture
         :param cam_model: CameraType, camera model
-        :param silent: bool, if True, do not print progress
+        :param silent: bool, if True, do not log progress (logged at INFO level to the lumaapi logger)
 
         :return: str, the slug identifier for checking the status etc
         """
-        tmp_path = None
-        if os.path.isdir(path):
-            path = path.rstrip("/").rstrip("\\")
-            tmp_path = os.path.join(os.path.dirname(path),
-                                    uuid.uuid4().hex)
-            if not silent:
-                print("Compressing directory", path, "to", tmp_path + ".zip")
-            path = shutil.make_archive(tmp_path, 'zip', path)
-            if not silent:
-                print("Compressed to", path)
-
-        with open(path, "rb") as f:
-            payload = f.read()
-        result = self.submit_binary(payload, title,
-                           cam_model=cam_model,
-                           silent=silent)
-        if tmp_path is not None and os.path.isfile(tmp_path):
-            os.remove(tmp_path)
-        return result
+        with contextlib.ExitStack() as stack:
+            if os.path.isdir(path):
+                if not silent:
+                    _logger.info("Compressing directory %s", path)
+                payload = stack.enter_context(_zipped_directory(path))
+                if not silent:
+                    size = (os.fstat(payload.fileno()).st_size if hasattr(payload, "fileno")
+                            else len(payload))
+                    _logger.info("Compressed to %d bytes", size)
+            else:
+                # Upload straight from a read-only mapping of the file
+                f = stack.enter_context(open(path, "rb"))
+                payload = stack.enter_context(_mapped_file(f))
+            return self.submit_binary(payload, title,
+                               cam_model=cam_model,
+                               silent=silent)
 
     def submit_binary(self,
-               payload: bytes,
+               payload: Union[bytes, memoryview, mmap.mmap, IO[bytes]],
                title: str,
                cam_model: CameraType = CameraType.NORMAL,
                silent: bool = False,
@@ -429,13 +863,14 @@ class LumaClient:
         Returns the slug. After submissing, use status(slug) to check the status
         and output artifacts.
 
-        :param payload: bytes,
+        :param payload: bytes, memoryview/mmap, or binary file object to stream the upload from
         :param title: str, a descriptive title for the capture
         :param cam_model: CameraType, camera model
+        :param silent: bool, if True, do not log progress (logged at INFO level to the lumaapi logger)
 
         :return: str, the slug identifier for checking the status etc
         """
-        auth_headers = self.auth()
+        self.auth()
 
         # 1. Create capture
         capture_data = {
@@ -443,34 +878,79 @@ class LumaClient:
             'camModel': cam_model.value,
         }
         if not silent:
-            print("Capture data", capture_data)
-        response = requests.post(f"{API_BASE_URL}capture",
-                                 headers=auth_headers, data=capture_data)
+            _logger.info("Capture data %s", capture_data)
+        response = self._request("POST", self._capture_url, data=capture_data)
         response.raise_for_status()
-        capture_data = response.json()
+        capture_data = _json_loads(response.content)
         upload_url = capture_data['signedUrls']['source']
         slug = capture_data['capture']['slug']
         if not silent:
-            print("Created capture", slug)
-            print("Uploading")
+            _logger.info("Created capture %s", slug)
+            _logger.info("Uploading")
 
         # 2. Upload video or zip
-        response = requests.put(upload_url, headers={'Content-Type': 'text/plain'}, data=payload)
+        # The signed URL carries its own credentials, so do not send the API key
+        response = self._request("PUT", upload_url,
+                                 headers={'Content-Type': 'text/plain', 'Authorization': None},
+                                 data=payload, timeout=UPLOAD_TIMEOUT)
         response.raise_for_status()
 
-        time.sleep(0.5)
         if not silent:
-            print("Triggering")
-
-        # 3. Trigger processing
-        response = requests.post(f"{API_BASE_URL}capture/{slug}", headers=auth_headers)
+            _logger.info("Triggering")
+
+        # 3. Trigger processing. The upload can take a moment to become
+        # visible to the API, so back off and retry only while it says so
+        for delay in _TRIGGER_RETRY_DELAYS + (None,):
+            response = self._request("POST", f"{self._capture_url}/{slug}")
+            if response.status_code not in _TRIGGER_RETRY_STATUSES or delay is None:
+                break
+            time.sleep(delay)
         response.raise_for_status()
 
         if not silent:
-            print("Submitted", slug)
+            _logger.info("Submitted %s", slug)
         return slug
 
 
+    def submit_many(self,
+                    paths: Union[str, List[str]],
+                    titles: Union[str, List[str]],
+                    cam_model: CameraType = CameraType.NORMAL,
+                    silent: bool = False,
+                    max_workers: int = _POOL_MAXSIZE) -> List[Union[str, Exception]]:
+        """
+        .. code-block:: shell
+
+            luma submit-many '["<path1>", "<path2>"]' '["<title1>", "<title2>"]'
+
+        Submit several videos, zips, or directories concurrently, see :meth:`.submit`.
+        A failed submission does not stop the others; its exception is returned
+        in place of the slug so the slugs of successful submissions are kept
+
+        :param paths: list of str, paths to submit (a single str is treated as one path)
+        :param titles: list of str, a descriptive title for each path
+        :param cam_model: CameraType, camera model used for all captures
+        :param silent: bool, if True, do not log progress (logged at INFO level to the lumaapi logger)
+        :param max_workers: int, maximum number of concurrent submissions
+
+        :return: list of str or Exception, the slug (or the error raised while submitting)
+                 for each path, in the same order as paths
+        """
+        paths, titles = _as_list(paths), _as_list(titles)
+        if len(paths) != len(titles):
+            raise ValueError("paths and titles must have the same length")
+        # Authenticate up front so worker threads never prompt
+        self.auth()
+        results = _map_collecting_errors(
+                lambda path, title: self.submit(path, title, cam_model=cam_model, silent=silent),
+                max_workers, paths, titles)
+        if not silent:
+            for path, result in zip(paths, results):
+                if isinstance(result, Exception):
+                    _logger.warning("Failed to submit %s: %s", path, result)
+        return results
+
+
     def status(self, slug: str) -> LumaCaptureInfo:
         """
         .. code-block:: shell
@@ -483,10 +963,10 @@ class LumaClient:
 
         :return: LumaCaptureInfo dataclass
         """
-        auth_headers = self.auth()
-        response = requests.get(f"{API_BASE_URL}capture/{slug}", headers=auth_headers)
+        self.auth()
+        response = self._request("GET", f"{self._capture_url}/{slug}")
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         if self.is_cli:
             # Force fire to display it rather than trying to
             # run subcommands
@@ -494,6 +974,28 @@ class LumaClient:
         return LumaCaptureInfo.from_dict(data)
 
 
+    def status_many(self,
+                    slugs: Union[str, List[str]],
+                    max_workers: int = _POOL_MAXSIZE) -> List[Union[LumaCaptureInfo, Exception]]:
+        """
+        .. code-block:: shell
+
+            luma status-many '["<slug1>", "<slug2>"]'
+
+        Check the status of several submitted captures concurrently.
+        As with :meth:`.submit_many`, a failed request does not stop the others;
+        its exception is returned in place of the status
+
+        :param slugs: list of str, slugs of captures to check (from submit()), a single str is treated as one slug
+        :param max_workers: int, maximum number of concurrent requests
+
+        :return: list of LumaCaptureInfo dataclass or Exception, in the same order as slugs
+        """
+        # Authenticate up front so worker threads never prompt
+        self.auth()
+        return _map_collecting_errors(self.status, max_workers, _as_list(slugs))
+
+
     def get(self,
             query: str="",
             skip : int=0,
@@ -513,16 +1015,58 @@ class LumaClient:
 
         :return: list of LumaCaptureInfo dataclass
         """
-        auth_headers = self.auth()
-        query = urllib.parse.quote(query)
-        skip = int(skip)
-        take = int(take)
-        order = "DESC" if desc else "ASC"
-        url = f"{API_BASE_URL}capture?"
+        data = self._get_page(query, skip, take, desc)
+        return list(map(LumaCaptureInfo.from_dict, data["captures"]))
+
+
+    def get_all(self,
+                query: str="",
+                desc: bool = True,
+                max_workers: int = _POOL_MAXSIZE) -> List[LumaCaptureInfo]:
+        """
+        .. code-block:: shell
+
+            luma get-all <query>
+
+        Find all of the user's API captures matching query, across all pages.
+        If the API reports the total count, the remaining pages are fetched concurrently.
+
+        :param query: str, query string to filter captures by (title)
+        :param desc: bool, whether to sort in descending order
+        :param max_workers: int, maximum number of pages to fetch at once
+
+        :return: list of LumaCaptureInfo dataclass
+        """
+        data = self._get_page(query, 0, _PAGE_SIZE, desc)
+        captures = data["captures"]
+        total = data.get("count")
+        if total is not None:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pages = executor.map(
+                        lambda skip: self._get_page(query, skip, _PAGE_SIZE, desc)["captures"],
+                        range(_PAGE_SIZE, total, _PAGE_SIZE))
+                captures = list(itertools.chain(captures, *pages))
+        else:
+            # Total unknown, page through until a short page
+            page = captures
+            while len(page) == _PAGE_SIZE:
+                page = self._get_page(query, len(captures), _PAGE_SIZE, desc)["captures"]
+                captures.extend(page)
+        return list(map(LumaCaptureInfo.from_dict, captures))
+
+
+    def _get_page(self, query: str, skip: int, take: int, desc: bool) -> Dict:
+        """
+        Fetch one page of the capture listing as the raw response dict
+        """
+        self.auth()
+        params = {
+            "skip": int(skip),
+            "take": int(take),
+            "order": "DESC" if desc else "ASC",
+        }
         if query:
-            url += f"search={query}&"
-        response = requests.get(url + f"skip={skip}&take={take}&order={order}",
-                                headers=auth_headers)
+            params["search"] = query
+        response = self._request("GET", self._capture_url, params=params)
         response.raise_for_status()
-        data = response.json()
-        return [LumaCaptureInfo.from_dict(x) for x in data["captures"]]
+        return _json_loads(response.content)
@@ -21,7 +21,16 @@
 
 from lumaapi import LumaClient
 import fire
+import logging
 
 def entrypoint():
+    # Show submission progress, which the library logs at INFO level,
+    # without reconfiguring logging for other libraries
+    logger = logging.getLogger("lumaapi")
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
     fire.Fire(LumaClient(is_cli=True))
 